@@ -1,10 +1,9 @@
 """ Classes that support cards and decks, their values and behavior """
 
-from functools import total_ordering
+from collections import deque
+from operator import attrgetter
 import random
 
-random.seed()  # Defaults to current system time
-
 
 # pylint: disable=too-few-public-methods
 class Suit:
@@ -16,7 +15,8 @@ class Suit:
     HEART = 3
     CLUB = 4
 
-    # Easily iterable set of suits
+    # Easily iterable suits, in order. This is a tuple rather than a set so
+    # that the cards in ALL_CARDS (and so a new Deck) come out sorted.
     ALL_SUITS = (SPADE, DIAMOND, HEART, CLUB)
 
     # Printable names for the suits
@@ -28,10 +28,21 @@ class Suit:
     }
 
 
-@total_ordering
+# pylint: disable=too-many-instance-attributes
 class Card:
     """ Class representing a single card, with a suit and value """
 
+    __slots__ = (
+        "suit",
+        "value",
+        "points",
+        "pretty_suit",
+        "pretty_value",
+        "_key",
+        "_str",
+        "_repr",
+    )
+
     # Printable names for the special ones
     _PRETTY_VALUE = {
         11: "Jack",
@@ -45,86 +56,166 @@ class Card:
         assert suit in Suit.ALL_SUITS
         assert isinstance(value, int)
         assert 2 <= value <= 14
+        self._set_fields(suit, value)
+
+    @classmethod
+    def _new(cls, suit, value):
+        """Create a card without sanity checking the inputs
+
+        Only for internal callers that already know the suit and value are
+        valid, such as building ALL_CARDS.
+        """
+        card = cls.__new__(cls)
+        card._set_fields(suit, value)
+        return card
+
+    def _set_fields(self, suit, value):
+        """ Store the suit and value, and everything derived from them """
         self.suit = suit
         self.value = value
 
+        # The calculated value of this card, used to score hands
+        self.points = suit * value
+
+        # Ordering is first by suit value, then by card value. Values fit in
+        # four bits, so packing the suit above them gives a single integer
+        # that orders the same way.
+        self._key = (suit << 4) | value
+
+        # Printable names, defaulting to the number for the value. There are
+        # only 52 cards and they don't change, so the printed forms are built
+        # here rather than on every print.
+        self.pretty_suit = Suit.PRETTY_NAME[suit]
+        self.pretty_value = Card._PRETTY_VALUE.get(value, value)
+        self._str = f"{self.pretty_value} of {self.pretty_suit}s"
+        self._repr = f"({self.pretty_suit}, {self.pretty_value})"
+
     def __eq__(self, other):
         """ Equality comparison should rely on same type, suit and value """
-        if not isinstance(other, type(self)):
-            return False
-        return self.suit == other.suit and self.value == other.value
+        if not isinstance(other, Card):
+            return NotImplemented
+        return self._key == other._key
+
+    def __hash__(self):
+        """ Hash on the same key as equality, so cards can go in sets """
+        return self._key
 
     def __lt__(self, other):
-        """Ordering is first by suit value, then by card value
+        """ Ordering is first by suit value, then by card value """
+        return self._key < other._key
 
-        (Our comparisons are symmetric and sensible, so total_ordering can
-        take it from here)
-        """
-        if self.suit == other.suit:
-            return self.value < other.value
-        return self.suit < other.suit
+    def __le__(self, other):
+        """ See __lt__ """
+        return self._key <= other._key
+
+    def __gt__(self, other):
+        """ See __lt__ """
+        return self._key > other._key
+
+    def __ge__(self, other):
+        """ See __lt__ """
+        return self._key >= other._key
 
     def __str__(self):
         """A more readable representation
 
         "2 of Hearts" for example"""
-        return f"{self.pretty_value} of {self.pretty_suit}s"
+        return self._str
 
     def __repr__(self):
         """A more compact representation
 
         "(Jack, Spade)" for example"""
-        return f"({self.pretty_suit}, {self.pretty_value})"
+        return self._repr
 
-    @property
-    def points(self):
-        """ Return the calculated value of this card """
-        return self.suit * self.value
 
-    @property
-    def pretty_value(self):
-        """ Look up the pretty value, defaulting to the number """
-        return Card._PRETTY_VALUE.get(self.value, self.value)
+# Sort key for cards, so sorting reads each card's key once and then compares
+# plain integers rather than calling Card.__lt__
+_card_key = attrgetter("_key")
 
-    @property
-    def pretty_suit(self):
-        """ Look up the nice name for the suit. """
-        return Suit.PRETTY_NAME[self.suit]
+# Every possible card, in sorted order. Cards don't change once created, so
+# all decks share these objects rather than building their own.
+ALL_CARDS = tuple(
+    # pylint: disable-next=protected-access
+    Card._new(a, b) for a in Suit.ALL_SUITS for b in range(2, 15)
+)
 
 
 class Deck:
     """ Class representing a standard deck of cards """
 
+    __slots__ = ("cards", "pile", "_random")
+
     def __init__(self):
         """Init the deck
 
-        We create a list of cards with values 2 through 14, and an empty
-        discard pile.
+        We create a deque of cards with values 2 through 14 (copied from
+        ALL_CARDS), and an empty discard pile. A deque rather than a list,
+        so that drawing from the top doesn't shift every other card down.
+
+        Shuffles use the random module's shared generator until the deck is
+        given its own with seed(). Until then _random is None rather than the
+        module, so that decks can still be copied and pickled.
         """
-        self.cards = [Card(a, b) for a in Suit.ALL_SUITS for b in range(2, 15)]
+        self.cards = deque(ALL_CARDS)
         self.pile = []
+        self._random = None
+
+    def reset(self):
+        """Put every card back in the deck, in sorted order.
+
+        This is a cheap way to get a fresh deck (it copies ALL_CARDS rather
+        than sorting), and it keeps the deck's random number generator.
+        """
+        self.cards = deque(ALL_CARDS)
+        self.pile = []
+
+    def seed(self, seed=None):
+        """Give this deck its own random number generator for shuffling.
+
+        Decks seeded with the same value shuffle the same way, which makes
+        games repeatable. With no seed, the new generator is seeded from the
+        system as usual.
+        """
+        self._random = random.Random(seed)
 
     def combine_deck_and_pile(self):
         """ Add the discard pile back to the deck """
         self.cards.extend(self.pile)
         self.pile = []
 
-    def shuffle(self):
+    def shuffle(self, count=None):
         """Shuffle this deck.
 
-        This assumes that we should recombine the pile first.
+        This assumes that we should recombine the pile first. If count is
+        given, only that many cards from the top are shuffled: they are a
+        random draw from the whole deck, but the cards under them are left
+        in no particular order. This is all that's needed when only those
+        cards will be drawn before the next shuffle.
         """
         self.combine_deck_and_pile()
-        new_cards = []
-
-        # Remove 52 cards from the old deck one by one, each time randomly
-        # choosing which of the remaning cards to pull out. This method
-        # keeps memory use relatively stable (all card objects are preserved,
-        # and a temporary list stores them), and shuffles in a single pass.
-        for i in range(51, -1, -1):
-            rand_card = random.randint(0, i)
-            new_cards.append(self.cards.pop(rand_card))
-        self.cards = new_cards
+        cards = self.cards
+        size = len(cards)
+        getrandbits = (self._random or random).getrandbits
+        if count is None or count > size - 1:
+            count = size - 1
+
+        # Fisher-Yates, in place: walk down from the top card, each time
+        # swapping it with a randomly chosen card at or below it. Every card
+        # is swapped at most once, no temporary list is needed, and we can
+        # stop as soon as the top `count` cards are settled.
+        for i in range(count):
+            # Pick one of the `left` remaining cards by drawing just enough
+            # random bits, and trying again when they land past the end.
+            # This is what randrange does underneath, without the layers of
+            # Python calls and argument checks around it.
+            left = size - i
+            bits = left.bit_length()
+            offset = getrandbits(bits)
+            while offset >= left:
+                offset = getrandbits(bits)
+            j = i + offset
+            cards[i], cards[j] = cards[j], cards[i]
 
     def draw_one(self):
         """Draw a card from the deck.
@@ -132,21 +223,20 @@ class Deck:
         It goes into the discard pile, and the Card is returned to the caller.
         If there are no more cards left, an IndexError is raised
         """
-        next_card = self.cards.pop(0)
+        next_card = self.cards.popleft()
         self.pile.append(next_card)
         return next_card
 
     def sort(self):
         """Sort the deck.
 
-        We can use sorted because Cards have a proper ordering.
-        The assumption here is that it's preferable to sort them rather than
-        statically define the (known) set of 52 cards that will always
+        Cards have a proper ordering, and we sort on the integer key behind
+        it. The assumption here is that it's preferable to sort them rather
+        than statically define the (known) set of 52 cards that will always
         represent a standard sorted deck.
 
-        The second assumption is that we're not concerned with memory use, as
-        this will create a copy of the deck list temporarily, rather than
-        sorting in place.
+        A deque can't be sorted in place, so this sorts a copy of the cards
+        and puts them back in a new deque.
         """
         self.combine_deck_and_pile()
-        self.cards = sorted(self.cards)
+        self.cards = deque(sorted(self.cards, key=_card_key))
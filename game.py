@@ -9,6 +9,8 @@ class Player:
     The player keeps a hand of cards and a handle to the deck used
     """
 
+    __slots__ = ("hand", "deck")
+
     def __init__(self, deck):
         """ Initialize the player with the given deck and an empty hand """
         self.hand = []
@@ -20,10 +22,6 @@ class Player:
         self.hand.append(card)
         return card
 
-    def __hash__(self):
-        """ Define a hash function so that this can be a key in dictionaries """
-        return hash(id(self))
-
     def reset(self):
         """ Get the player back to default starting state """
         self.hand = []
@@ -31,7 +29,7 @@ class Player:
     @property
     def hand_value(self):
         """ Return the current value of the hand (sum of all card points) """
-        return sum((card.points for card in self.hand))
+        return sum(card.points for card in self.hand)
 
 
 class Game:
@@ -41,54 +39,96 @@ class Game:
     then run the game and report the results.
     """
 
-    def __init__(self, quiet=False):
+    # What to say for player 2 winning, a tie, or player 1 winning
+    _RESULT_MESSAGES = (
+        "Player 2 wins!",
+        "Players tie and there is no winner!",
+        "Player 1 wins!",
+    )
+
+    def __init__(self, quiet=False, emit=print):
         """Init the game
 
-        If quiet is true, console messages will be suppressed
+        If quiet is true, console messages will be suppressed. Otherwise each
+        line of a message is passed to emit, which prints it by default.
         """
         self.deck = Deck()
         self.player1 = Player(self.deck)
         self.player2 = Player(self.deck)
         self._quiet = quiet
+        self.emit = emit
 
     def draw_cards(self):
         """ Players alternate drawing until they have drawn 3 each """
+        draw1 = self.player1.draw_one
+        draw2 = self.player2.draw_one
+        quiet = self._quiet
+        emit = self.emit
         for _ in range(3):
-            card1 = self.player1.draw_one()
-            card2 = self.player2.draw_one()
-            if not self._quiet:
-                print(f"Player 1 draws {card1}")
-                print(f"Player 2 draws {card2}\n--------")
+            card1 = draw1()
+            card2 = draw2()
+            if not quiet:
+                emit(f"Player 1 draws {card1}")
+                emit(f"Player 2 draws {card2}")
+                emit("--------")
 
     def compare_hands(self):
         """ Player points are calculated and the winner is returned """
 
-        points1 = self.player1.hand_value
-        points2 = self.player2.hand_value
-        winner = None
+        player1 = self.player1
+        player2 = self.player2
+        points1 = player1.hand_value
+        points2 = player2.hand_value
+
+        # -1, 0 or 1 for player 2 winning, a tie, or player 1 winning, which
+        # then picks the winner (and message) without any more comparisons
+        result = (points1 > points2) - (points1 < points2)
+        winner = (player2, None, player1)[result + 1]
         if not self._quiet:
-            print(f"Player 1 scores {points1} points!")
-            print(f"Player 2 scores {points2} points!")
-        if points1 != points2:
-            winner = self.player1 if points1 > points2 else self.player2
-            if not self._quiet:
-                print(f"Player {1 if points1 >= points2 else 2} wins!")
-        else:
-            if not self._quiet:
-                print("Players tie and there is no winner!")
+            emit = self.emit
+            emit(f"Player 1 scores {points1} points!")
+            emit(f"Player 2 scores {points2} points!")
+            emit(Game._RESULT_MESSAGES[result + 1])
         return winner
 
+    def reset(self):
+        """ Get the deck and both players back to their starting state """
+        self.deck.reset()
+        self.player1.reset()
+        self.player2.reset()
+
     def play(self):
         """Play the game one time.
 
         Each player is reset to an empty hand and the deck is shuffled.
+        Only the six cards that will be dealt need shuffling, so each game
+        starts from the whole deck for just six swaps.
         The winning player is returned.
         """
         self.player1.reset()
         self.player2.reset()
-        self.deck.shuffle()
+        self.deck.shuffle(6)
 
         self.draw_cards()
         winner = self.compare_hands()
 
         return winner
+
+    @staticmethod
+    def simulate(count, seed=None):
+        """Simulate `count` games at once, for estimating win rates.
+
+        This doesn't touch the game's deck or players. It uses the compiled
+        Numba simulation if Numba is installed, and otherwise the NumPy one;
+        these are only imported here so the rest of the game works without
+        them. The same seed gives different games with each of them, but
+        both check it the same way (see sim_numpy.check_seed).
+        Returns a tuple of (player 1 wins, player 2 wins).
+        """
+        # pylint: disable=import-outside-toplevel
+        try:
+            from essex.sim_numba import simulate_games
+        except ImportError:
+            from essex.sim_numpy import simulate_games
+
+        return simulate_games(count, seed)
@@ -0,0 +1,81 @@
+""" Simulate many games at once with a Numba-compiled loop
+
+Like sim_numpy, this is optional and needs Numba (and so NumPy) installed.
+The whole shuffle, deal and score loop is compiled, so unlike sim_numpy it
+never builds more than one deck per game in memory, and games are spread
+over all available cores.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+from essex.sim_numpy import POINTS, check_seed
+
+# Constants for seeding each game's generator with splitmix64
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+_MIX1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX2 = np.uint64(0x94D049BB133111EB)
+
+
+@njit(cache=True)
+def _seed_game(seed, game):
+    """ Derive a non-zero xorshift64 state for one game from the seed """
+    state = seed + np.uint64(game + 1) * _GOLDEN
+    state = (state ^ (state >> np.uint64(30))) * _MIX1
+    state = (state ^ (state >> np.uint64(27))) * _MIX2
+    state ^= state >> np.uint64(31)
+    return state if state else np.uint64(1)
+
+
+@njit(cache=True, parallel=True)
+def _simulate(points, seed, out):
+    """Play one game per entry of `out`, storing the winner of each
+
+    Winners are stored as 1 or 2 for the player, or 0 for a tie. Every game
+    has its own generator seeded from its index, so the results don't
+    depend on how the games are spread over threads.
+    """
+    deck_size = points.shape[0]
+    # pylint: disable-next=not-an-iterable
+    for game in prange(out.shape[0]):
+        state = _seed_game(seed, game)
+        deck = points.copy()
+
+        # Fisher-Yates, stopped after the six cards that are dealt. Any bias
+        # from taking the random number modulo at most 52 is negligible with
+        # 64 random bits.
+        for i in range(6):
+            state ^= state << np.uint64(13)
+            state ^= state >> np.uint64(7)
+            state ^= state << np.uint64(17)
+            j = i + np.int64(state % np.uint64(deck_size - i))
+            deck[i], deck[j] = deck[j], deck[i]
+
+        # Players alternate draws, so player 1 holds the even cards
+        score1 = np.int64(deck[0]) + deck[2] + deck[4]
+        score2 = np.int64(deck[1]) + deck[3] + deck[5]
+        if score1 > score2:
+            out[game] = 1
+        elif score2 > score1:
+            out[game] = 2
+        else:
+            out[game] = 0
+
+
+def simulate_games(count, seed=None):
+    """Play `count` games and return how many each player won
+
+    This gives the same kind of result as sim_numpy.simulate_games, a tuple
+    of (player 1 wins, player 2 wins), though the same seed won't give the
+    same games. The first call in a process compiles the loop (or loads it
+    from Numba's cache), which takes far longer than the games themselves.
+    """
+    seed = check_seed(seed)
+    if seed is None:
+        seed = np.random.SeedSequence().generate_state(1, np.uint64)[0]
+    winners = np.empty(count, dtype=np.int8)
+    _simulate(POINTS, np.uint64(seed), winners)
+    return (
+        int(np.count_nonzero(winners == 1)),
+        int(np.count_nonzero(winners == 2)),
+    )
@@ -0,0 +1,84 @@
+""" Simulate many games at once using NumPy
+
+This is an optional part of the package: NumPy is only needed when these
+functions are used. Rather than Card objects, every deck is an array of
+indices into ALL_CARDS, so a whole batch of games is a handful of array
+operations instead of a Python loop per game.
+"""
+
+import operator
+
+import numpy as np
+
+from essex.cards import ALL_CARDS
+
+# Points for each card, indexed by its position in ALL_CARDS
+POINTS = np.array([card.points for card in ALL_CARDS], dtype=np.int8)
+
+# Games to simulate per batch. Each game needs its own deck and a few arrays
+# of random indices, so this caps memory use (at a few MB) however many games
+# are requested.
+_BATCH_SIZE = 100_000
+
+
+def check_seed(seed):
+    """Check a seed for either simulation, returning it as a plain int
+
+    Seeds are None (to seed from the system) or integers that fit in 64
+    unsigned bits, which is what the Numba generator can hold. Anything else
+    raises a TypeError for the wrong type, or a ValueError out of range.
+    """
+    if seed is None:
+        return None
+    seed = operator.index(seed)
+    if not 0 <= seed < 2**64:
+        raise ValueError(f"seed must be between 0 and 2**64 - 1, got {seed}")
+    return seed
+
+
+def score_hands(deals):
+    """Score both players' hands for a batch of games at once
+
+    `deals` holds a row per game of the six cards dealt, as indices into
+    ALL_CARDS in the order they were drawn. Players alternate draws, so
+    player 1 holds cards 0, 2 and 4 of each row and player 2 holds 1, 3 and
+    5. The result has a row per game of (player 1 points, player 2 points).
+    A ValueError is raised if the rows aren't six cards each.
+    """
+    deals = np.asarray(deals)
+    if deals.size == 0:
+        return np.zeros((0, 2), dtype=np.int16)
+    if deals.ndim != 2 or deals.shape[1] != 6:
+        raise ValueError(f"expected rows of 6 cards, got shape {deals.shape}")
+    points = POINTS[deals].reshape(deals.shape[0], 3, 2)
+    return points.sum(axis=1, dtype=np.int16)
+
+
+def simulate_games(count, seed=None):
+    """Play `count` games and return how many each player won
+
+    Every game is dealt from its own freshly shuffled deck, with players
+    alternating draws as in Game.draw_cards. The result is a tuple of
+    (player 1 wins, player 2 wins); any other games were ties.
+    """
+    rng = np.random.default_rng(check_seed(seed))
+    deck_size = len(POINTS)
+    wins1 = wins2 = 0
+    for start in range(0, count, _BATCH_SIZE):
+        games = min(_BATCH_SIZE, count - start)
+        decks = np.tile(np.arange(deck_size, dtype=np.int8), (games, 1))
+        rows = np.arange(games)
+
+        # Fisher-Yates on every deck at once, stopped after the six cards
+        # that are dealt, as Game.play does: each step swaps column i with a
+        # randomly chosen column at or after it, separately for every row
+        for i in range(6):
+            swap = rng.integers(i, deck_size, size=games)
+            chosen = decks[rows, swap]
+            decks[rows, swap] = decks[:, i]
+            decks[:, i] = chosen
+
+        scores = score_hands(decks[:, :6])
+        wins1 += int(np.count_nonzero(scores[:, 0] > scores[:, 1]))
+        wins2 += int(np.count_nonzero(scores[:, 0] < scores[:, 1]))
+    return wins1, wins2
@@ -1,4 +1,7 @@
 """ Tests for classes in the cards module """
+from collections import deque
+import copy
+import pickle
 import unittest
 from essex.cards import Card, Deck, Suit
 
@@ -25,6 +28,12 @@ class TestSuit(unittest.TestCase):
             len(Suit.ALL_SUITS), 4, "Incorrect number of suits found"
         )
 
+    def test_all_suits_ordered(self):
+        """ Test that ALL_SUITS iterates the suits in point order """
+        self.assertEqual(
+            Suit.ALL_SUITS, (Suit.SPADE, Suit.DIAMOND, Suit.HEART, Suit.CLUB)
+        )
+
     def test_pretty_names(self):
         """ Test that the pretty names are correct """
         expected = (
@@ -55,12 +64,34 @@ class TestCard(unittest.TestCase):
             card = Card(Suit.SPADE, i)
             self.assertEqual(card.value, i)
 
+    def test_unchecked_card(self):
+        """ Tests that the unchecked factory builds the same card as init """
+        for suit in Suit.ALL_SUITS:
+            for value in range(2, 15):
+                card = Card(suit, value)
+                # pylint: disable-next=protected-access
+                fast_card = Card._new(suit, value)
+                self.assertEqual(card, fast_card)
+                self.assertEqual(card.points, fast_card.points)
+                self.assertEqual(str(card), str(fast_card))
+                self.assertEqual(repr(card), repr(fast_card))
+
     def test_card_not_equal_other(self):
         """ Tests that cards are not equal to other types of objects """
         card = Card(Suit.SPADE, 2)
         for bad_value in ("a", "1", "2", 2, 20.0, Card):
             self.assertNotEqual(card, bad_value)
 
+    def test_card_hash(self):
+        """ Tests that equal cards hash the same, and all 52 are distinct """
+        self.assertEqual(hash(Card(Suit.HEART, 9)), hash(Card(Suit.HEART, 9)))
+        cards = {
+            Card(suit, value)
+            for suit in Suit.ALL_SUITS
+            for value in range(2, 15)
+        }
+        self.assertEqual(len(cards), 52)
+
     def test_bad_card_suit(self):
         """ Test creating a card with an invalid suit """
         for bad_suit in ("bad", -1, 0, 5, 100):
@@ -314,6 +345,58 @@ class TestDeck(unittest.TestCase):
                     self.fail("Found two shuffles that were the same!")
             self._sanity_check(deck)
 
+    def test_partial_shuffle(self):
+        """Tests shuffling only the top few cards of the deck
+
+        The top cards should be a random draw from the whole deck, even after
+        cards have been drawn, so we check that they vary between decks in
+        the same way as the full shuffle test does.
+        """
+        count = 6
+        decks = [Deck() for _ in range(10)]
+        tops = []
+        for deck in decks:
+            deck.draw_one()
+            deck.shuffle(count)
+            self.assertEqual(len(deck.cards), 52)
+            self._sanity_check(deck)
+            tops.append(list(deck.cards)[:count])
+
+        for i, top in enumerate(tops):
+            for other in tops[i + 1 :]:
+                self.assertNotEqual(top, other)
+
+    def test_seed(self):
+        """ Tests that decks seeded the same way shuffle the same way """
+        deck1 = Deck()
+        deck2 = Deck()
+        deck1.seed(1234)
+        deck2.seed(1234)
+
+        for _ in range(3):
+            deck1.shuffle()
+            deck2.shuffle()
+            self.assertEqual(deck1.cards, deck2.cards)
+            self._sanity_check(deck1)
+
+        deck2.seed(4321)
+        deck1.shuffle()
+        deck2.shuffle()
+        self.assertNotEqual(deck1.cards, deck2.cards)
+
+    def test_copy_unseeded(self):
+        """ Tests that a deck without its own generator can be copied """
+        deck = Deck()
+        deck.draw_one()
+        copied = copy.deepcopy(deck)
+        self.assertEqual(list(copied.cards), list(deck.cards))
+        self.assertEqual(copied.pile, deck.pile)
+        copied.shuffle()
+        self._sanity_check(copied)
+
+        unpickled = pickle.loads(pickle.dumps(deck))
+        self.assertEqual(list(unpickled.cards), list(deck.cards))
+
     def test_sort_shuffled(self):
         """Tests that shuffled decks get sorted correctly.
 
@@ -378,6 +461,31 @@ class TestDeck(unittest.TestCase):
         self.assertEqual(len(deck.pile), 0)
         self._sanity_check(deck)
 
+    def test_reset(self):
+        """ Tests that resetting a deck gives back the full sorted deck """
+        deck = Deck()
+        deck.shuffle()
+        for _ in range(15):
+            deck.draw_one()
+
+        deck.reset()
+        self.assertEqual(deck.pile, [])
+        self.assertEqual(list(deck.cards), TestDeck.ALL_CARDS)
+
+    def test_cards_changed_in_place(self):
+        """ Tests that changes to deck.cards stick, and assigning it works """
+        deck = Deck()
+        top = deck.cards.popleft()
+        self.assertEqual(len(deck.cards), 51)
+        self.assertNotIn(top, deck.cards)
+
+        deck.cards.appendleft(top)
+        self.assertEqual(deck.draw_one(), top)
+
+        deck.cards = deque([top])
+        self.assertEqual(deck.draw_one(), top)
+        self.assertRaises(IndexError, deck.draw_one)
+
     def test_sort_combines(self):
         """ Tests that sorting a deck also recombines it with its pile """
         draws = 15
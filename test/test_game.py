@@ -1,11 +1,16 @@
 """ Tests for classes in the game module """
 
+import copy
 import unittest
 from unittest import mock
 from io import StringIO
+from pathlib import Path
 from essex.cards import Card, Deck, Suit
 from essex.game import Game, Player
 
+# Expected transcripts of game messages, one file per scenario
+SNAPSHOTS = Path(__file__).parent / "snapshots"
+
 
 class TestPlayer(unittest.TestCase):
     """ Tests for the Player class """
@@ -69,6 +74,27 @@ class TestPlayer(unittest.TestCase):
             player.hand_value, card1.points + card2.points + card3.points
         )
 
+    def test_hand_value_draws(self):
+        """ Tests that the hand value keeps up with draws and resets """
+        deck = Deck()
+        player = Player(deck)
+
+        for _ in range(3):
+            player.draw_one()
+            self.assertEqual(
+                player.hand_value, sum(card.points for card in player.hand)
+            )
+
+        player.reset()
+        self.assertEqual(player.hand_value, 0)
+
+    def test_hand_value_changed_in_place(self):
+        """ Tests that the hand value sees cards added to the hand directly """
+        player = Player(Deck())
+        card = Card(Suit.CLUB, 14)
+        player.hand.append(card)
+        self.assertEqual(player.hand_value, card.points)
+
 
 class TestGame(unittest.TestCase):
     """ Tests for the Game class """
@@ -79,6 +105,9 @@ class TestGame(unittest.TestCase):
         This is taken to mean that on average, the players should win about
         equally as often, as the shuffle should be random, and players have
         equal expected values with no benefit of going first or second.
+
+        The deck is seeded so the result is the same on each run rather than
+        failing now and then by chance.
         """
         # Games to run and number of decimal places to look at the win ratio
         # We can increase iterations and tolerance for more confidence, at the
@@ -87,18 +116,19 @@ class TestGame(unittest.TestCase):
         tolerance = 1
 
         game = Game(quiet=True)
-        win_count = {game.player1: 0, game.player2: 0}
+        game.deck.seed(1234)
+        wins1 = wins2 = 0
 
         for _ in range(iterations):
             winner = game.play()
-            if winner is not None:
-                win_count[winner] += 1
+            wins1 += winner is game.player1
+            wins2 += winner is game.player2
 
-        win_ratio = win_count[game.player1] / win_count[game.player2]
+        win_ratio = wins1 / wins2
 
         self.assertAlmostEqual(1.0, win_ratio, tolerance)
-        self.assertNotEqual(win_count[game.player1], 0)
-        self.assertNotEqual(win_count[game.player2], 0)
+        self.assertNotEqual(wins1, 0)
+        self.assertNotEqual(wins2, 0)
 
     def test_draw_cards(self):
         """ Tests that drawing cards functions correctly """
@@ -109,7 +139,8 @@ class TestGame(unittest.TestCase):
 
     def test_compare_player1_wins(self):
         """ Tests comparing hands and player1 has more points """
-        game = Game()
+        output = []
+        game = Game(emit=output.append)
 
         # 25 points
         game.player1.hand = [
@@ -124,18 +155,20 @@ class TestGame(unittest.TestCase):
             Card(Suit.SPADE, 5),
             Card(Suit.HEART, 5),
         ]
-        with mock.patch("sys.stdout", new=StringIO()) as output:
-            self.assertEqual(game.compare_hands(), game.player1)
-            expected_output = (
-                "Player 1 scores 25 points!\n"
-                "Player 2 scores 24 points!\n"
-                "Player 1 wins!\n"
-            )
-            self.assertEqual(output.getvalue(), expected_output)
+        self.assertEqual(game.compare_hands(), game.player1)
+        self.assertEqual(
+            output,
+            [
+                "Player 1 scores 25 points!",
+                "Player 2 scores 24 points!",
+                "Player 1 wins!",
+            ],
+        )
 
     def test_compare_player_2_wins(self):
         """ Tests comparing hands and player2 has more points """
-        game = Game()
+        output = []
+        game = Game(emit=output.append)
 
         # 24 points
         game.player1.hand = [
@@ -150,18 +183,20 @@ class TestGame(unittest.TestCase):
             Card(Suit.SPADE, 3),
             Card(Suit.CLUB, 5),
         ]
-        with mock.patch("sys.stdout", new=StringIO()) as output:
-            self.assertEqual(game.compare_hands(), game.player2)
-            expected_output = (
-                "Player 1 scores 24 points!\n"
-                "Player 2 scores 25 points!\n"
-                "Player 2 wins!\n"
-            )
-            self.assertEqual(output.getvalue(), expected_output)
+        self.assertEqual(game.compare_hands(), game.player2)
+        self.assertEqual(
+            output,
+            [
+                "Player 1 scores 24 points!",
+                "Player 2 scores 25 points!",
+                "Player 2 wins!",
+            ],
+        )
 
     def test_compare_neither_player_wins(self):
         """ Tests comparing hands and players tie """
-        game = Game()
+        output = []
+        game = Game(emit=output.append)
 
         # 25 points
         game.player1.hand = [
@@ -176,14 +211,15 @@ class TestGame(unittest.TestCase):
             Card(Suit.SPADE, 3),
             Card(Suit.CLUB, 5),
         ]
-        with mock.patch("sys.stdout", new=StringIO()) as output:
-            self.assertIsNone(game.compare_hands())
-            expected_output = (
-                "Player 1 scores 25 points!\n"
-                "Player 2 scores 25 points!\n"
-                "Players tie and there is no winner!\n"
-            )
-            self.assertEqual(output.getvalue(), expected_output)
+        self.assertIsNone(game.compare_hands())
+        self.assertEqual(
+            output,
+            [
+                "Player 1 scores 25 points!",
+                "Player 2 scores 25 points!",
+                "Players tie and there is no winner!",
+            ],
+        )
 
     def test_play(self):
         """Test playing a full game and then repeating with the same players.
@@ -206,11 +242,46 @@ class TestGame(unittest.TestCase):
             else:
                 self.assertIsNone(winner)
 
+    def test_reset(self):
+        """ Tests that resetting a game gives a full deck and empty hands """
+        game = Game(quiet=True)
+        game.play()
+        game.reset()
+
+        self.assertEqual(game.player1.hand, [])
+        self.assertEqual(game.player2.hand, [])
+        self.assertEqual(game.player1.hand_value, 0)
+        self.assertEqual(game.deck.pile, [])
+        self.assertEqual(list(game.deck.cards), sorted(game.deck.cards))
+        self.assertEqual(len(game.deck.cards), 52)
+
+    def test_copy_unseeded(self):
+        """ Tests that a game whose deck isn't seeded can be copied """
+        game = Game(quiet=True)
+        copied = copy.deepcopy(game)
+        self.assertIs(copied.player1.deck, copied.deck)
+        self.assertIs(copied.player2.deck, copied.deck)
+        copied.play()
+        self.assertEqual(len(copied.player1.hand), 3)
+
     def test_printed_messages_draw_cards(self):
         """ Tests that friendly messages are printed for game conditions """
+        output = []
+        game = Game(emit=output.append)
+        game.draw_cards()
+        transcript = "".join(f"{line}\n" for line in output).encode()
+        self.assertEqual(
+            transcript, (SNAPSHOTS / "draw_cards.txt").read_bytes()
+        )
+
+    def test_messages_printed_by_default(self):
+        """ Tests that without an emit function, messages go to stdout """
         game = Game()
         with mock.patch("sys.stdout", new=StringIO()) as output:
-            expected_output = (
+            game.draw_cards()
+            game.compare_hands()
+            self.assertEqual(
+                output.getvalue(),
                 "Player 1 draws 2 of Spades\n"
                 "Player 2 draws 3 of Spades\n"
                 "--------\n"
@@ -220,6 +291,14 @@ class TestGame(unittest.TestCase):
                 "Player 1 draws 6 of Spades\n"
                 "Player 2 draws 7 of Spades\n"
                 "--------\n"
+                "Player 1 scores 12 points!\n"
+                "Player 2 scores 15 points!\n"
+                "Player 2 wins!\n",
             )
-            game.draw_cards()
-            self.assertEqual(output.getvalue(), expected_output)
+
+    def test_quiet(self):
+        """ Tests that a quiet game doesn't emit any messages """
+        output = []
+        game = Game(quiet=True, emit=output.append)
+        game.play()
+        self.assertEqual(output, [])
@@ -0,0 +1,16 @@
+""" Tests for the Numba game simulation """
+
+import unittest
+from essex.test import test_sim_numpy
+
+try:
+    from essex import sim_numba
+except ImportError:
+    sim_numba = None
+
+
+@unittest.skipIf(sim_numba is None, "Numba is not installed")
+class TestSimNumba(test_sim_numpy.SimulationTests):
+    """ Tests for the compiled batch simulation """
+
+    sim = sim_numba
@@ -0,0 +1,114 @@
+""" Tests for the NumPy game simulation """
+
+import unittest
+from essex.cards import ALL_CARDS
+from essex.game import Game
+
+try:
+    from essex import sim_numpy
+except ImportError:
+    sim_numpy = None
+
+
+class SimulationTests(unittest.TestCase):
+    """Tests shared by the NumPy and Numba simulations
+
+    Subclasses set `sim` to the simulation module. This class has none of
+    its own, so its tests are skipped when it is run directly.
+    """
+
+    sim = None
+
+    @classmethod
+    def setUpClass(cls):
+        """ Skip the shared tests unless a simulation module is given """
+        if cls.sim is None:
+            raise unittest.SkipTest("no simulation module to test")
+
+    def test_counts(self):
+        """ Tests that wins and ties account for every game played """
+        for games in (0, 1, 10, 1000):
+            wins1, wins2 = self.sim.simulate_games(games)
+            self.assertGreaterEqual(wins1, 0)
+            self.assertGreaterEqual(wins2, 0)
+            self.assertLessEqual(wins1 + wins2, games)
+
+    def test_seed(self):
+        """ Tests that the same seed gives the same results """
+        self.assertEqual(
+            self.sim.simulate_games(1000, seed=1234),
+            self.sim.simulate_games(1000, seed=1234),
+        )
+
+    def test_bad_seed(self):
+        """ Tests that seeds out of range or of the wrong type are rejected """
+        for seed in (-1, 2**64):
+            with self.assertRaises(ValueError):
+                self.sim.simulate_games(10, seed=seed)
+        with self.assertRaises(TypeError):
+            self.sim.simulate_games(10, seed=1.5)
+
+    def test_fairness(self):
+        """Tests that players win about equally often over many games
+
+        As with the Game fairness test, this relies on large numbers; the
+        seed keeps the result the same from run to run.
+        """
+        wins1, wins2 = self.sim.simulate_games(200_000, seed=1234)
+        self.assertAlmostEqual(1.0, wins1 / wins2, 1)
+
+
+@unittest.skipIf(sim_numpy is None, "NumPy is not installed")
+class TestSimNumpy(SimulationTests):
+    """ Tests for the batched NumPy simulation """
+
+    sim = sim_numpy
+
+    def test_points(self):
+        """ Tests that the points table matches the cards """
+        self.assertEqual(len(sim_numpy.POINTS), len(ALL_CARDS))
+        for i, card in enumerate(ALL_CARDS):
+            self.assertEqual(sim_numpy.POINTS[i], card.points)
+
+    def test_score_hands(self):
+        """ Tests that hands are scored the same way as a Game scores them """
+        game = Game(quiet=True)
+        game.deck.seed(1234)
+        deals = []
+        expected = []
+        for _ in range(100):
+            game.play()
+            deals.append(
+                [
+                    ALL_CARDS.index(card)
+                    for pair in zip(game.player1.hand, game.player2.hand)
+                    for card in pair
+                ]
+            )
+            expected.append(
+                [game.player1.hand_value, game.player2.hand_value]
+            )
+
+        self.assertEqual(sim_numpy.score_hands(deals).tolist(), expected)
+
+    def test_score_no_hands(self):
+        """ Tests that scoring no games gives an empty row of scores """
+        self.assertEqual(sim_numpy.score_hands([]).shape, (0, 2))
+
+    def test_score_wrong_width(self):
+        """ Tests that deals which aren't rows of six cards are rejected """
+        for deals in ([[0] * 5] * 6, [0] * 12, [[[0] * 6]]):
+            with self.assertRaises(ValueError):
+                sim_numpy.score_hands(deals)
+
+    def test_game_simulate(self):
+        """Tests that Game.simulate runs a batch of games
+
+        It may use either simulation depending on what's installed, so we
+        only check that the results are sensible and repeatable.
+        """
+        wins1, wins2 = Game.simulate(1000, seed=1234)
+        self.assertLessEqual(wins1 + wins2, 1000)
+        self.assertEqual((wins1, wins2), Game.simulate(1000, seed=1234))
+        with self.assertRaises(ValueError):
+            Game.simulate(10, seed=-1)